@@ -9,15 +9,26 @@ validate correct calls during CI/CD.
 """
 
 import asyncio
+import bisect
+import heapq
 import inspect
+import itertools
 import json
+import operator
 import sys
+import threading
 import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
+from types import FunctionType
+from types import MappingProxyType
+from types import MethodType
 from types import ModuleType
 from typing import Any
 from typing import Callable
 from typing import Coroutine
+from typing import Iterable
+from typing import Mapping
 from typing import Optional
 from typing import Union
 
@@ -30,11 +41,54 @@ __version__ = f"{version_major}.{version_minor}.{version_patch}"
 
 
 class SignatureMismatchError(Exception):
-    """Raised when callback signatures don't match for a namespace."""
+    """
+    Raised when callback signatures don't match for a namespace.
+
+    The message is only formatted when the error is displayed.
+    """
+
+    def __init__(
+        self, namespace: str, expected: frozenset[str], provided: frozenset[str]
+    ) -> None:
+        super().__init__(namespace, expected, provided)
+        self.namespace = namespace
+        self.expected = expected
+        self.provided = provided
+
+    def __str__(self) -> str:
+        return (
+            f"Callback parameter mismatch for namespace '{self.namespace}'. "
+            f"Expected parameters: {sorted(self.expected)}, "
+            f"but got: {sorted(self.provided)}"
+        )
 
 
 class EmitArgumentError(Exception):
-    """Raised when emit arguments don't match subscriber signatures."""
+    """
+    Raised when emit arguments don't match subscriber signatures.
+
+    The message is only formatted when the error is displayed.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        sub_namespace: str,
+        expected: frozenset[str],
+        provided: frozenset[str],
+    ) -> None:
+        super().__init__(namespace, sub_namespace, expected, provided)
+        self.namespace = namespace
+        self.sub_namespace = sub_namespace
+        self.expected = expected
+        self.provided = provided
+
+    def __str__(self) -> str:
+        return (
+            f"Argument mismatch when emitting to '{self.namespace}'. "
+            f"Subscribers in '{self.sub_namespace}' expect: {sorted(self.expected)}, "
+            f"but got: {sorted(self.provided)}"
+        )
 
 
 CALLBACK = Union[Callable[..., Any], Callable[..., Coroutine[Any, Any, Any]]]
@@ -48,7 +102,7 @@ If you want data back, create an event going the opposite direction.
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Subscriber(object):
     """A subscriber with a callback and priority."""
 
@@ -68,23 +122,631 @@ class Subscriber(object):
     namespace: str
     """The namespace the subscriber is listening to."""
 
+    order: tuple[int, int]
+    """
+    (-priority, registration sequence). Subscribers run in ascending order,
+    so equal priorities keep registration order across namespaces too.
+    """
+
+    raw: bool = False
+    """If the callback receives the emitted kwargs as a single dict."""
+
+    positional: Optional[tuple[str, ...]] = None
+    """The emitted kwargs passed to the callback positionally, in order."""
+
     @property
     def callback(self) -> Optional[CALLBACK]:
         """Get the live callback, or None if collected."""
         return self.weak_callback()
 
 
-_SUBSCRIBERS: dict[str, list[Subscriber]] = {}
+def _intern(name: str) -> str:
+    """
+    Intern a namespace or argument name as an exact str. sys.intern() rejects
+    str subclasses, such as str enum members, which are otherwise valid names.
+    """
+    return sys.intern(str.__str__(name))
+
+
+_REGISTRATION_SEQUENCE = itertools.count()
+"""Numbers every registered subscriber, breaking ties between priorities."""
+
+_execution_order = operator.attrgetter("order")
+"""
+C implemented key for inserting and merging subscribers in execution order,
+saving a Python call per subscriber.
+"""
+
+_priority = operator.attrgetter("priority")
+"""C implemented key for grouping subscribers already in execution order."""
+
+
+def _insert_subscriber(
+    subscribers: tuple[Subscriber, ...], subscriber: Subscriber
+) -> tuple[Subscriber, ...]:
+    """Return a copy of subscribers with subscriber at its execution position."""
+    index = bisect.bisect_right(subscribers, subscriber.order, key=_execution_order)
+    return subscribers[:index] + (subscriber,) + subscribers[index:]
+
+
+_SUBSCRIBERS: dict[str, tuple[Subscriber, ...]] = {}
 """
 The broker's record of each namespace to subscribers.
 
+Each tuple is kept in execution order, highest priority first, with equal
+priorities in registration order.
+
+Tuples are never mutated, changes swap in a new tuple (copy-on-write). An emit
+iterates the snapshot it looked up, unaffected by subscribers registering or
+unregistering during dispatch, from a callback or from another thread.
+
 This is kept outside of the replaced module class to create a protected
 closure around the event namespace:subscriber structure.
 """
 
-_NAMESPACE_SIGNATURES: dict[str, Optional[set[str]]] = {}
+_SYNC_SUBSCRIBERS: dict[str, tuple[Subscriber, ...]] = {}
+"""
+The synchronous subset of each namespace's subscribers, in the same order.
+
+Sync/async status is fixed at registration, so emit() iterates this instead
+of filtering out async subscribers on every call.
+"""
+
+_NAMESPACE_SIGNATURES: dict[str, Optional[frozenset[str]]] = {}
 """Track the expected keyword arguments for each namespace."""
 
+_STRICT_NAMESPACES: set[str] = set()
+"""
+The namespaces whose signature is not None. While empty, every subscriber
+accepts **kwargs and emitting skips argument validation altogether.
+"""
+
+_REGISTRY_GENERATION = 0
+"""
+Incremented whenever namespaces, their signatures or their subscribers
+change, invalidating anything cached from them.
+"""
+
+
+def _bump_registry_generation() -> None:
+    """Invalidate everything cached from the current namespaces."""
+    global _REGISTRY_GENERATION
+    _REGISTRY_GENERATION += 1
+
+
+_REGISTRY_LOCK = threading.RLock()
+"""
+Serializes changes to the subscriber tables, trie and signatures.
+
+Emitting never takes it. Subscriber tuples are replaced rather than mutated,
+so an emit always iterates a consistent snapshot while a writer works.
+Reentrant so a weakref collected mid-change can clean up on the same thread.
+"""
+
+_CACHE_LOCK = threading.Lock()
+"""Serializes inserts and evictions in the emit caches."""
+
+
+def _lru_put(cache: OrderedDict, key: str, value: Any, maxsize: int) -> None:
+    """Store a cache entry, evicting the least recently used past maxsize."""
+    with _CACHE_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+
+
+def _lru_touch(cache: OrderedDict, key: str) -> None:
+    """Mark a cache entry as recently used, if another thread kept it."""
+    try:
+        cache.move_to_end(key)
+    except KeyError:
+        pass
+
+
+_EMIT_VALIDATION_CACHE: OrderedDict[
+    str, tuple[int, Optional[frozenset[str]], tuple[str, ...]]
+] = OrderedDict()
+"""
+Emitted namespace -> (registry generation, expected arguments, validated
+subscriber namespaces).
+
+Expected arguments are the single signature shared by every validated
+subscriber namespace, or None when they disagree and emitting must fail.
+
+Least recently emitted namespaces are evicted past _EMIT_VALIDATION_CACHE_SIZE
+so namespaces built at runtime (ids, paths, etc.) can't grow it unbounded.
+"""
+
+_EMIT_VALIDATION_CACHE_SIZE = 1024
+
+
+def _validate_emit_args(
+    namespace: str,
+    kwargs: dict[str, Any],
+    matched: list[str],
+    generation: int,
+) -> None:
+    """
+    Validate that emit arguments match subscriber signatures.
+
+    Args:
+        namespace (str): The namespace being emitted to.
+        kwargs (dict[str, Any]): The keyword arguments being emitted.
+        matched (list[str]): The subscriber namespaces matching the
+            emitted namespace.
+        generation (int): The registry generation matched was resolved at.
+    Raises:
+        EmitArgumentError: If provided kwargs don't match subscriber signatures.
+    """
+    # Stamped with the generation of matched rather than the current one, so
+    # a change since resolving leaves the entry stale rather than wrongly
+    # current.
+    cached = _EMIT_VALIDATION_CACHE.get(namespace)
+    if cached is not None and cached[0] == generation:
+        _lru_touch(_EMIT_VALIDATION_CACHE, namespace)
+    else:
+        signatures = {}
+        for sub_namespace in matched:
+            # **kwargs not validated, nor namespaces removed since matching.
+            signature = _NAMESPACE_SIGNATURES.get(sub_namespace)
+            if signature is not None:
+                signatures[sub_namespace] = signature
+
+        validated = tuple(signatures)
+        distinct = set(signatures.values())
+        expected = distinct.pop() if len(distinct) == 1 else None
+        cached = (generation, expected, validated)
+        _lru_put(_EMIT_VALIDATION_CACHE, namespace, cached, _EMIT_VALIDATION_CACHE_SIZE)
+
+    _, expected, validated = cached
+    if not validated or kwargs.keys() == expected:
+        return
+
+    provided_args = kwargs.keys()  # Supports set comparison as is
+
+    for sub_namespace in validated:
+        expected_params = _NAMESPACE_SIGNATURES.get(sub_namespace)
+
+        if expected_params is not None and provided_args != expected_params:
+            raise EmitArgumentError(
+                namespace, sub_namespace, expected_params, frozenset(provided_args)
+            )
+
+
+def _call_sync(
+    namespace: str, subscribers: tuple[Subscriber, ...], kwargs: dict[str, Any]
+) -> None:
+    """
+    Call synchronous subscribers in order, each the way it was registered.
+
+    Args:
+        namespace (str): The namespace being emitted to.
+        subscribers (tuple[Subscriber, ...]): The resolved sync subscribers.
+        kwargs (dict[str, Any]): The keyword arguments being emitted.
+    """
+    built = _positional_cache()
+    for subscriber in subscribers:
+        # Dereferenced directly rather than through the callback property.
+        callback = subscriber.weak_callback()
+        if callback is None:
+            continue  # Collected by an earlier callback of this emit.
+
+        _invoke(namespace, subscriber, callback, kwargs, built)
+
+
+_PositionalCache = dict[tuple[str, ...], tuple[Any, ...]]
+"""Positional arguments built during one emit, keyed by their names."""
+
+_POSITIONAL_REGISTERED = False
+"""
+If a positional subscriber was registered since the last clear(). Until then
+emits don't set up the arguments positional subscribers share.
+"""
+
+
+def _positional_cache() -> Optional[_PositionalCache]:
+    """Get a positional argument cache for one emit, if one may be needed."""
+    return {} if _POSITIONAL_REGISTERED else None
+
+
+def _invoke(
+    namespace: str,
+    subscriber: Subscriber,
+    callback: CALLBACK,
+    kwargs: dict[str, Any],
+    built: Optional[_PositionalCache],
+) -> Any:
+    """
+    Call a subscriber's callback the way it was registered.
+
+    Args:
+        namespace (str): The namespace being emitted to.
+        subscriber (Subscriber): The subscriber being called.
+        callback (CALLBACK): The subscriber's live callback.
+        kwargs (dict[str, Any]): The keyword arguments being emitted.
+        built (Optional[_PositionalCache]): The positional arguments already
+            built during this emit, or None to build them unshared.
+    Returns:
+        Any: What the callback returned, a coroutine for async callbacks.
+    Raises:
+        EmitArgumentError: If an emitted kwarg a positional subscriber needs
+            is missing.
+    """
+    if subscriber.positional is not None:
+        return callback(*_positional_args(namespace, subscriber, kwargs, built))
+    if subscriber.raw:
+        return callback(kwargs)
+    return callback(**kwargs)
+
+
+def _positional_args(
+    namespace: str,
+    subscriber: Subscriber,
+    kwargs: dict[str, Any],
+    built: Optional[_PositionalCache],
+) -> tuple[Any, ...]:
+    """
+    Get the positional arguments of a positional subscriber for one emit.
+
+    Args:
+        namespace (str): The namespace being emitted to.
+        subscriber (Subscriber): The subscriber being called.
+        kwargs (dict[str, Any]): The keyword arguments being emitted.
+        built (Optional[_PositionalCache]): The arguments already built during
+            this emit, or None to build them unshared.
+    Returns:
+        tuple[Any, ...]: The emitted values in the subscriber's order.
+    Raises:
+        EmitArgumentError: If an emitted kwarg the subscriber needs is missing.
+    """
+    names = subscriber.positional
+    args = built.get(names) if built is not None else None
+    if args is None:
+        try:
+            args = tuple([kwargs[name] for name in names])
+        except KeyError:
+            # Only reachable when **kwargs subscribers disable validation.
+            raise EmitArgumentError(
+                namespace, subscriber.namespace, frozenset(names), frozenset(kwargs)
+            ) from None
+        if built is not None:
+            built[names] = args
+
+    return args
+
+
+_CallbackInfo = tuple[Optional[frozenset[str]], bool]
+"""A callback's parameter names (None if it accepts **kwargs) and async state."""
+
+_CALLBACK_INFO: weakref.WeakKeyDictionary[Any, _CallbackInfo] = (
+    weakref.WeakKeyDictionary()
+)
+"""
+Cached _CallbackInfo per callback so inspect.signature() and
+asyncio.iscoroutinefunction() run once per function, not once per
+registration. Weakly keyed to not keep callbacks alive.
+"""
+
+_METHOD_INFO: weakref.WeakKeyDictionary[Any, _CallbackInfo] = (
+    weakref.WeakKeyDictionary()
+)
+"""
+Cached _CallbackInfo for bound methods, keyed by the underlying function as a
+new method object is created on every attribute access.
+"""
+
+
+_NO_CHILDREN: Mapping[str, "_TrieNode"] = MappingProxyType({})
+"""
+Shared read-only children of every leaf node. Most nodes are leaves, so they
+only get a dict of their own once a child is added below them.
+"""
+
+
+class _TrieNode(object):
+    """
+    A single dot separated segment of the subscriber namespace trie.
+
+    Nodes hold the subscriber namespaces ending at them, which key into
+    _SUBSCRIBERS and _SYNC_SUBSCRIBERS. The trie only indexes the tables.
+    """
+
+    __slots__ = ("children", "exact", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: Mapping[str, _TrieNode] = _NO_CHILDREN
+        """The next namespace segments below this node."""
+
+        self.exact: Optional[str] = None
+        """The registered namespace ending at this node."""
+
+        self.wildcard: Optional[str] = None
+        """The registered wildcard namespace rooted at this node."""
+
+
+_SUBSCRIBER_TRIE = _TrieNode()
+"""
+Index over _SUBSCRIBERS keyed by namespace segments.
+
+Emitting walks only the path of the emitted namespace, collecting wildcard
+subscribers along the way, instead of testing every registered namespace.
+"""
+
+
+_WILDCARD_COUNT = 0
+"""
+The number of wildcard namespaces in the trie. While zero, an emitted
+namespace can only match itself and the trie walk is skipped.
+"""
+
+
+def _split_namespace(namespace: str) -> tuple[list[str], bool]:
+    """Split a subscriber namespace into its trie path and wildcard state."""
+    if namespace.endswith(".*"):
+        return namespace[:-2].split("."), True
+
+    return namespace.split("."), False
+
+
+def _trie_insert(namespace: str) -> None:
+    """Index a newly created namespace."""
+    global _WILDCARD_COUNT
+    parts, is_wildcard = _split_namespace(namespace)
+
+    node = _SUBSCRIBER_TRIE
+    for part in parts:
+        child = node.children.get(part)
+        if child is None:
+            children = node.children
+            if children is _NO_CHILDREN:
+                children = node.children = {}
+            child = children[sys.intern(part)] = _TrieNode()
+        node = child
+
+    if is_wildcard:
+        node.wildcard = namespace
+        _WILDCARD_COUNT += 1
+    else:
+        node.exact = namespace
+
+
+def _trie_remove(namespace: str) -> None:
+    """Drop a deleted namespace from the trie, pruning emptied nodes."""
+    global _WILDCARD_COUNT
+    parts, is_wildcard = _split_namespace(namespace)
+
+    path = [_SUBSCRIBER_TRIE]
+    for part in parts:
+        child = path[-1].children.get(part)
+        if child is None:
+            return
+        path.append(child)
+
+    if is_wildcard:
+        path[-1].wildcard = None
+        _WILDCARD_COUNT -= 1
+    else:
+        path[-1].exact = None
+
+    for depth in range(len(parts), 0, -1):
+        node = path[depth]
+        if node.children or node.exact is not None or node.wildcard is not None:
+            break
+        parent = path[depth - 1]
+        del parent.children[parts[depth - 1]]
+        if not parent.children:
+            parent.children = _NO_CHILDREN
+
+
+def _trie_clear() -> None:
+    """Drop every namespace from the trie."""
+    global _WILDCARD_COUNT
+    _SUBSCRIBER_TRIE.children = _NO_CHILDREN
+    _WILDCARD_COUNT = 0
+
+
+def _trie_match(namespace: str) -> list[str]:
+    """
+    Collect the subscriber namespaces that should receive an emitted namespace.
+
+    Args:
+        namespace (str): The namespace where the event was emitted.
+    Returns:
+        list[str]: Each matching subscriber namespace. Wildcards come first
+            from the root down, followed by the exact match.
+    """
+    if not _WILDCARD_COUNT:
+        return [namespace] if namespace in _SUBSCRIBERS else []
+
+    *roots, leaf = namespace.split(".")
+    matched = []
+    append = matched.append
+
+    # Wildcard subscribers only receive events below their root, so they are
+    # collected from every segment but the last.
+    node = _SUBSCRIBER_TRIE
+    for part in roots:
+        node = node.children.get(part)
+        if node is None:
+            return matched
+        if node.wildcard is not None:
+            append(node.wildcard)
+
+    node = node.children.get(leaf)
+    if node is not None and node.exact is not None:
+        append(node.exact)
+
+    return matched
+
+
+def _by_priority(
+    table: dict[str, tuple[Subscriber, ...]], matched: list[str]
+) -> Iterable[Subscriber]:
+    """
+    Iterate the subscribers of every matched namespace in execution order.
+
+    Each tuple in the table is already sorted, so multiple matches are merged
+    rather than concatenated and sorted again. Equal priorities keep
+    registration order across the matched namespaces.
+
+    Args:
+        table (dict[str, tuple[Subscriber, ...]]): _SUBSCRIBERS or
+            _SYNC_SUBSCRIBERS.
+        matched (list[str]): The subscriber namespaces to dispatch to.
+    Returns:
+        Iterable[Subscriber]: Subscribers from highest to lowest priority.
+    """
+    # Namespaces may be deleted by another thread after matching.
+    if len(matched) == 1:
+        return table.get(matched[0], ())
+
+    subscribers = [table.get(ns, ()) for ns in matched]
+    return heapq.merge(*subscribers, key=_execution_order)
+
+
+_Resolved = tuple[int, list[str], tuple[Subscriber, ...], tuple[Subscriber, ...]]
+"""
+(registry generation, matched subscriber namespaces, sync subscribers, all
+subscribers) for an emitted namespace, subscribers in execution order.
+"""
+
+_RESOLVE_CACHE: OrderedDict[str, _Resolved] = OrderedDict()
+"""
+Emitted namespace -> its resolved subscribers, so repeated emits skip the
+trie walk and priority merge. Stale generations are re-resolved lazily and
+the least recently emitted namespaces are evicted past _RESOLVE_CACHE_SIZE.
+"""
+
+_RESOLVE_CACHE_SIZE = 1024
+
+_UNRESOLVED: _Resolved = (-1, [], (), ())
+"""Resolution of an emitted namespace no subscriber namespace can match."""
+
+_DEDUPLICATE = False
+"""
+If a callback subscribed through several matching namespaces is called only
+once per emit, at its highest priority subscription. See set_deduplicate().
+"""
+
+
+def _unique_callbacks(subscribers: Iterable[Subscriber]) -> tuple[Subscriber, ...]:
+    """Keep the first subscriber of each callback, preserving order."""
+    seen = set()
+    unique = []
+    for subscriber in subscribers:
+        callback = subscriber.callback
+        # Bound methods are rebuilt on every dereference, key them by parts.
+        key = (
+            id(getattr(callback, "__self__", None)),
+            id(getattr(callback, "__func__", callback)),
+        )
+        if key not in seen:
+            seen.add(key)
+            unique.append(subscriber)
+
+    return tuple(unique)
+
+
+def _resolve(namespace: str) -> _Resolved:
+    """
+    Get the subscribers that should receive an emitted namespace.
+
+    Args:
+        namespace (str): The namespace where the event was emitted.
+    Returns:
+        _Resolved: The cached or freshly resolved subscribers.
+    """
+    generation = _REGISTRY_GENERATION
+    resolved = _RESOLVE_CACHE.get(namespace)
+    if resolved is not None and resolved[0] == generation:
+        _lru_touch(_RESOLVE_CACHE, namespace)
+        return resolved
+
+    # Every subscriber namespace lies below its first segment's trie node, so
+    # namespaces rooted elsewhere are rejected without caching an empty entry
+    # that would evict live ones.
+    if _WILDCARD_COUNT:
+        if namespace.partition(".")[0] not in _SUBSCRIBER_TRIE.children:
+            return _UNRESOLVED
+    elif namespace not in _SUBSCRIBERS:
+        return _UNRESOLVED
+
+    # Stamped with the generation read before resolving, so a concurrent
+    # change leaves the entry stale rather than wrongly current.
+    matched = _trie_match(namespace)
+    order = _unique_callbacks if _DEDUPLICATE and len(matched) > 1 else tuple
+    resolved = (
+        generation,
+        matched,
+        order(_by_priority(_SYNC_SUBSCRIBERS, matched)),
+        order(_by_priority(_SUBSCRIBERS, matched)),
+    )
+    _lru_put(_RESOLVE_CACHE, namespace, resolved, _RESOLVE_CACHE_SIZE)
+
+    return resolved
+
+
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+"""
+Tasks scheduled by emit_nowait() and emit_async_nowait() that are still
+running. The event loop only keeps weak references to tasks, so they are held
+here until done.
+"""
+
+
+def _schedule(loop: asyncio.AbstractEventLoop, coroutine: Coroutine) -> asyncio.Task:
+    """Run a coroutine as a task on the loop, keeping it alive until done."""
+    task = loop.create_task(coroutine)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+
+BACKLOG_DROP_NEWEST = "drop_newest"
+"""Backlog policy skipping new async callbacks while the backlog is full."""
+
+BACKLOG_DROP_OLDEST = "drop_oldest"
+"""Backlog policy cancelling the oldest pending callback to make room."""
+
+
+class _Backlog(object):
+    """Limit on the pending emit_nowait() tasks of one subscriber namespace."""
+
+    __slots__ = ("maxsize", "policy", "tasks")
+
+    def __init__(self, maxsize: int, policy: str) -> None:
+        self.maxsize = maxsize
+        """The most tasks that may be pending at once."""
+
+        self.policy = policy
+        """What to do with a new callback while the backlog is full."""
+
+        self.tasks: dict[asyncio.Task, None] = {}
+        """The pending tasks, oldest first."""
+
+    def admit(self) -> bool:
+        """Make room for one more task if the policy allows it."""
+        if len(self.tasks) < self.maxsize:
+            return True
+        if self.policy == BACKLOG_DROP_OLDEST:
+            oldest = next(iter(self.tasks))
+            del self.tasks[oldest]
+            oldest.cancel()
+            return True
+
+        return False
+
+    def track(self, task: asyncio.Task) -> None:
+        """Count a task against the backlog until it is done."""
+        self.tasks[task] = None
+        task.add_done_callback(lambda done: self.tasks.pop(done, None))
+
+
+_BACKLOGS: dict[str, _Backlog] = {}
+"""Subscriber namespace -> the backlog limiting its emit_nowait() tasks."""
+
+
 _NOTIFY_NAMESPACE_ROOT = "broker.notify."
 BROKER_ON_SUBSCRIBER_ADDED = f"{_NOTIFY_NAMESPACE_ROOT}subscriber.added"
 BROKER_ON_SUBSCRIBER_REMOVED = f"{_NOTIFY_NAMESPACE_ROOT}subscriber.removed"
@@ -95,15 +757,85 @@ BROKER_ON_EMIT_ALL = f"{_NOTIFY_NAMESPACE_ROOT}emit.all"
 BROKER_ON_NAMESPACE_CREATED = f"{_NOTIFY_NAMESPACE_ROOT}namespace.created"
 BROKER_ON_NAMESPACE_DELETED = f"{_NOTIFY_NAMESPACE_ROOT}namespace.deleted"
 
+_NOTIFY_ON_SUBSCRIBE = 1 << 0
+_NOTIFY_ON_UNSUBSCRIBE = 1 << 1
+_NOTIFY_ON_COLLECTED = 1 << 2
+_NOTIFY_ON_EMIT = 1 << 3
+_NOTIFY_ON_EMIT_ASYNC = 1 << 4
+_NOTIFY_ON_EMIT_ALL = 1 << 5
+_NOTIFY_ON_NEW_NAMESPACE = 1 << 6
+_NOTIFY_ON_DEL_NAMESPACE = 1 << 7
+
+_NOTIFY_ON_ANY_EMIT = _NOTIFY_ON_EMIT | _NOTIFY_ON_EMIT_ALL
+_NOTIFY_ON_ANY_EMIT_ASYNC = _NOTIFY_ON_EMIT_ASYNC | _NOTIFY_ON_EMIT_ALL
+_NOTIFY_ON_REGISTER = _NOTIFY_ON_SUBSCRIBE | _NOTIFY_ON_NEW_NAMESPACE
+_NOTIFY_ON_UNREGISTER = _NOTIFY_ON_UNSUBSCRIBE | _NOTIFY_ON_DEL_NAMESPACE
+"""
+Notify flag bits of Broker._notify_flags, with the combinations each public
+call tests in a single and.
+"""
+
+
+class _NotifyFlag(object):
+    """
+    Broker attribute reading and writing one bit of its notify flags, so the
+    public notify_on_* booleans and the bitmask never disagree.
+    """
+
+    __slots__ = ("bit",)
+
+    def __init__(self, bit: int) -> None:
+        self.bit = bit
+
+    def __get__(self, broker: Optional["Broker"], owner: Optional[type] = None) -> bool:
+        if broker is None:
+            return self  # type: ignore[return-value]
+        return bool(broker._notify_flags & self.bit)
+
+    def __set__(self, broker: "Broker", enabled: bool) -> None:
+        if enabled:
+            broker._notify_flags |= self.bit
+        else:
+            broker._notify_flags &= ~self.bit
+
+
+_WeakCallback = Union[weakref.ref[Any], weakref.WeakMethod]
+"""A subscriber's weak reference to its callback."""
+
+
+class _WeakrefCleanup(object):
+    """
+    Weak reference callback reporting a collected subscriber's namespace and
+    dead reference.
+
+    A slotted instance is smaller and cheaper to create per subscriber than a
+    closure with its cells.
+    """
+
+    __slots__ = ("namespace", "on_collected_callback")
+
+    def __init__(
+        self,
+        namespace: str,
+        on_collected_callback: Callable[[str, _WeakCallback], None],
+    ) -> None:
+        self.namespace = namespace
+        """The namespace the collected subscriber was registered to."""
+
+        self.on_collected_callback = on_collected_callback
+        """Called with the namespace and reference once the callback is collected."""
+
+    def __call__(self, weak_callback: _WeakCallback) -> None:
+        self.on_collected_callback(self.namespace, weak_callback)
+
 
 def _make_weak_ref(
-    callback: CALLBACK, namespace: str, on_collected_callback: Callable[[str], None]
-) -> Union[weakref.ref[Any], weakref.WeakMethod]:
+    callback: CALLBACK,
+    namespace: str,
+    on_collected_callback: Callable[[str, _WeakCallback], None],
+) -> _WeakCallback:
     """Create appropriate weak reference for any callback type."""
-
-    def cleanup(_: Union[weakref.ref[Any], weakref.WeakMethod]) -> None:
-        # Arg needed to add for weakref creation.
-        on_collected_callback(namespace)
+    cleanup = _WeakrefCleanup(namespace, on_collected_callback)
 
     if hasattr(callback, "__self__"):
         return weakref.WeakMethod(callback, cleanup)
@@ -120,7 +852,12 @@ def _make_subscribe_decorator(broker_module: "Broker") -> Callable:
     it using a python namespace and thus creating a circular reference.
     """
 
-    def subscribe_(namespace: str, priority: int = 0) -> CALLBACK:
+    def subscribe_(
+        namespace: str,
+        priority: int = 0,
+        raw: bool = False,
+        positional: Optional[Iterable[str]] = None,
+    ) -> CALLBACK:
         """
         Decorator to register a function or static method as a subscriber.
 
@@ -134,12 +871,18 @@ def _make_subscribe_decorator(broker_module: "Broker") -> Callable:
         Args:
             namespace (str): The event namespace to subscribe to.
             priority (int): The execution priority. Defaults to 0.
+            raw (bool): Pass the emitted kwargs as a single dict. Defaults to
+                False.
+            positional (Optional[Iterable[str]]): Pass these emitted kwargs
+                positionally, in order. Defaults to None.
         Returns:
             Callable: Decorator function that registers the subscriber.
         """
 
         def decorator(func: CALLBACK) -> CALLBACK:
-            broker_module.register_subscriber(namespace, func, priority)
+            broker_module.register_subscriber(
+                namespace, func, priority, raw, positional
+            )
             return func
 
         return decorator
@@ -171,37 +914,113 @@ class Broker(ModuleType):
     BROKER_ON_NAMESPACE_CREATED = BROKER_ON_NAMESPACE_CREATED
     BROKER_ON_NAMESPACE_DELETED = BROKER_ON_NAMESPACE_DELETED
 
+    BACKLOG_DROP_NEWEST = BACKLOG_DROP_NEWEST
+    BACKLOG_DROP_OLDEST = BACKLOG_DROP_OLDEST
+
+    # -----Notifies-----
+    notify_on_subscribe = _NotifyFlag(_NOTIFY_ON_SUBSCRIBE)
+    notify_on_unsubscribe = _NotifyFlag(_NOTIFY_ON_UNSUBSCRIBE)
+    notify_on_collected = _NotifyFlag(_NOTIFY_ON_COLLECTED)
+    notify_on_emit = _NotifyFlag(_NOTIFY_ON_EMIT)
+    notify_on_emit_async = _NotifyFlag(_NOTIFY_ON_EMIT_ASYNC)
+    notify_on_emit_all = _NotifyFlag(_NOTIFY_ON_EMIT_ALL)
+    notify_on_new_namespace = _NotifyFlag(_NOTIFY_ON_NEW_NAMESPACE)
+    notify_on_del_namespace = _NotifyFlag(_NOTIFY_ON_DEL_NAMESPACE)
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         self.subscribe = _make_subscribe_decorator(self)
 
         # -----Notifies-----
         self.notify_on_all: bool = False
-        self.notify_on_subscribe: bool = False
-        self.notify_on_unsubscribe: bool = False
-        self.notify_on_collected: bool = False
-        self.notify_on_emit: bool = False
-        self.notify_on_emit_async: bool = False
-        self.notify_on_emit_all: bool = False
-        self.notify_on_new_namespace: bool = False
-        self.notify_on_del_namespace: bool = False
+        self._notify_flags: int = 0
 
     @staticmethod
     def clear() -> None:
-        _SUBSCRIBERS.clear()
-        _NAMESPACE_SIGNATURES.clear()
+        global _DEDUPLICATE, _POSITIONAL_REGISTERED
+        with _REGISTRY_LOCK:
+            _SUBSCRIBERS.clear()
+            _SYNC_SUBSCRIBERS.clear()
+            _trie_clear()
+            _NAMESPACE_SIGNATURES.clear()
+            _STRICT_NAMESPACES.clear()
+            _EMIT_VALIDATION_CACHE.clear()
+            _RESOLVE_CACHE.clear()
+            _BACKLOGS.clear()
+            _POSITIONAL_REGISTERED = False
+            _DEDUPLICATE = False
+            _bump_registry_generation()
 
     @staticmethod
-    def _get_callback_params(callback: CALLBACK) -> Union[set[str], None]:
+    def _get_callback_info(callback: CALLBACK) -> _CallbackInfo:
         """
-        Extract parameter names from a callback function.
+        Extract parameter names and async state from a callback function.
+
+        Results are cached per function, see _CALLBACK_INFO.
 
         Args:
             callback (CALLBACK): The callback function to inspect.
         Returns:
-            Union[set[str], None]: Set of parameter names, or None if callback
-                accepts **kwargs.
+            _CallbackInfo: Set of parameter names, or None if callback accepts
+                **kwargs, and whether the callback is a coroutine function.
         """
+        func = getattr(callback, "__func__", None)
+        if func is None:
+            key, cache = callback, _CALLBACK_INFO
+        else:
+            key, cache = func, _METHOD_INFO
+
+        try:
+            return cache[key]
+        except (KeyError, TypeError):
+            # TypeError - callback can't be weakly referenced or hashed.
+            pass
+
+        info = (
+            Broker._inspect_callback_params(callback),
+            Broker._inspect_callback_async(callback),
+        )
+        try:
+            cache[key] = info
+        except TypeError:
+            pass
+
+        return info
+
+    @staticmethod
+    def _inspect_callback_async(callback: CALLBACK) -> bool:
+        """Uncached async state of a callback, see _get_callback_info()."""
+        func = callback.__func__ if type(callback) is MethodType else callback
+
+        # A plain function without attributes can't carry the markers that
+        # asyncio.iscoroutinefunction() looks for, so its code flags decide.
+        if type(func) is FunctionType and not func.__dict__:
+            return bool(func.__code__.co_flags & inspect.CO_COROUTINE)
+
+        return asyncio.iscoroutinefunction(callback)
+
+    @staticmethod
+    def _inspect_callback_params(callback: CALLBACK) -> Union[frozenset[str], None]:
+        """Uncached parameter names of a callback, see _get_callback_info()."""
+        func, bound = callback, 0
+        if type(callback) is MethodType:
+            func, bound = callback.__func__, 1
+
+        # Plain functions are read straight from their code object, which is
+        # much cheaper than building a Signature. Wrapped functions and ones
+        # with an explicit __signature__ are left to inspect.
+        if (
+            type(func) is FunctionType
+            and not hasattr(func, "__wrapped__")
+            and not hasattr(func, "__signature__")
+        ):
+            code = func.__code__
+            if code.co_flags & inspect.CO_VARKEYWORDS:
+                return None
+            if code.co_argcount >= bound:
+                count = code.co_argcount + code.co_kwonlyargcount
+                return frozenset(code.co_varnames[bound:count])
+
         sig = inspect.signature(callback)
 
         # **kwargs is not tracked
@@ -209,26 +1028,46 @@ class Broker(ModuleType):
             if param.kind == inspect.Parameter.VAR_KEYWORD:
                 return None
 
-        return {
+        return frozenset(
             name
             for name, param in sig.parameters.items()
             if param.kind != inspect.Parameter.VAR_POSITIONAL  # exclude *args
-        }
+        )
 
-    def _on_callback_collected(self, namespace: str) -> None:
+    def _on_callback_collected(
+        self, namespace: str, weak_callback: _WeakCallback
+    ) -> None:
         """Called when a subscriber is garbage collected."""
-        if namespace in _SUBSCRIBERS:
-            _SUBSCRIBERS[namespace] = [
-                sub for sub in _SUBSCRIBERS[namespace] if sub.callback is not None
-            ]
-
-        if self.notify_on_collected and not namespace.startswith(
+        with _REGISTRY_LOCK:
+            # Find the dead reference itself rather than dereferencing every
+            # subscriber, which would rebuild each live bound method.
+            subscribers = _SUBSCRIBERS.get(namespace, ())
+            for index, subscriber in enumerate(subscribers):
+                if subscriber.weak_callback is weak_callback:
+                    _SUBSCRIBERS[namespace] = (
+                        subscribers[:index] + subscribers[index + 1 :]
+                    )
+                    if not subscriber.is_async:
+                        _SYNC_SUBSCRIBERS[namespace] = tuple(
+                            sub
+                            for sub in _SYNC_SUBSCRIBERS[namespace]
+                            if sub is not subscriber
+                        )
+                    _bump_registry_generation()
+                    break
+
+        if self._notify_flags & _NOTIFY_ON_COLLECTED and not namespace.startswith(
             _NOTIFY_NAMESPACE_ROOT
         ):
-            self.emit(namespace=BROKER_ON_SUBSCRIBER_COLLECTED, using=namespace)
+            self._notify(BROKER_ON_SUBSCRIBER_COLLECTED, namespace)
 
     def register_subscriber(
-        self, namespace: str, callback: CALLBACK, priority: int = 0
+        self,
+        namespace: str,
+        callback: CALLBACK,
+        priority: int = 0,
+        raw: bool = False,
+        positional: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Register a callback function to a namespace.
@@ -240,53 +1079,90 @@ class Broker(ModuleType):
                 be sync or async.
             priority (int): The priority used for callback execution order.
                 Higher priorities are ran before lower priorities.
+            raw (bool): Call the callback with the emitted kwargs as a single
+                dict instead of unpacking them as keyword arguments. The dict
+                is shared with every other raw subscriber of the emit, so it
+                should not be mutated. Raw callbacks accept any kwargs, like
+                callbacks taking **kwargs.
+            positional (Optional[Iterable[str]]): Names of the emitted kwargs
+                to pass to the callback as positional arguments, in order,
+                instead of unpacking them as keyword arguments. These names
+                become the callback's signature for validation. Subscribers
+                sharing the same names share the argument tuple built per emit.
         Raises:
             SignatureMismatchError: If callback signature doesn't match
                 existing subscribers.
+            ValueError: If both raw and positional are given.
         Notes:
             Emits a notify event when a namespace is created and when a
             subscriber is registered. Notify emits the used namespace.
         """
-        callback_params = Broker._get_callback_params(callback)
-        is_async = asyncio.iscoroutinefunction(callback)
+        global _POSITIONAL_REGISTERED
+        # Interned so every table, trie node and subscriber shares one string
+        # and key comparisons against it short circuit on identity.
+        namespace = _intern(namespace)
+        callback_params, is_async = Broker._get_callback_info(callback)
+        if raw:
+            if positional is not None:
+                raise ValueError("A subscriber can't be both raw and positional")
+            callback_params = None
+        elif positional is not None:
+            positional = tuple(_intern(name) for name in positional)
+            callback_params = frozenset(positional)
         weak_callback = _make_weak_ref(callback, namespace, self._on_callback_collected)
         subscriber = Subscriber(
             weak_callback=weak_callback,
             priority=priority,
             is_async=is_async,
             namespace=namespace,
+            order=(-priority, next(_REGISTRATION_SEQUENCE)),
+            raw=raw,
+            positional=positional,
         )
 
-        # If this is the first subscriber for this namespace, store signature
-        if namespace not in _NAMESPACE_SIGNATURES:
-            _NAMESPACE_SIGNATURES[namespace] = callback_params
-        else:
-            existing_params = _NAMESPACE_SIGNATURES[namespace]
+        with _REGISTRY_LOCK:
+            # If this is the first subscriber for this namespace, store signature
+            existing_params = _NAMESPACE_SIGNATURES.setdefault(
+                namespace, callback_params
+            )
 
             # If either accepts **kwargs, they're compatible
             if existing_params is None or callback_params is None:
                 _NAMESPACE_SIGNATURES[namespace] = None
+                _STRICT_NAMESPACES.discard(namespace)
             elif existing_params != callback_params:
                 raise SignatureMismatchError(
-                    f"Callback parameter mismatch for namespace '{namespace}'. "
-                    f"Expected parameters: {sorted(existing_params)}, "
-                    f"but got: {sorted(callback_params)}"
+                    namespace, existing_params, callback_params
                 )
+            else:
+                _STRICT_NAMESPACES.add(namespace)
+
+            created = namespace not in _SUBSCRIBERS
+            if created:
+                _SUBSCRIBERS[namespace] = ()
+                _SYNC_SUBSCRIBERS[namespace] = ()
+                _trie_insert(namespace)
+
+            if positional is not None:
+                # Set before an emit can resolve the subscriber.
+                _POSITIONAL_REGISTERED = True
+            _SUBSCRIBERS[namespace] = _insert_subscriber(
+                _SUBSCRIBERS[namespace], subscriber
+            )
+            if not is_async:
+                _SYNC_SUBSCRIBERS[namespace] = _insert_subscriber(
+                    _SYNC_SUBSCRIBERS[namespace], subscriber
+                )
+            _bump_registry_generation()
 
-        if namespace not in _SUBSCRIBERS:
-            _SUBSCRIBERS[namespace] = []
-            if (
-                not namespace.startswith(_NOTIFY_NAMESPACE_ROOT)
-                and self.notify_on_new_namespace
-            ):
-                self.emit(namespace=BROKER_ON_NAMESPACE_CREATED, using=namespace)
-
-        _SUBSCRIBERS[namespace].append(subscriber)
-        if (
-            not namespace.startswith(_NOTIFY_NAMESPACE_ROOT)
-            and self.notify_on_subscribe
-        ):
-            self.emit(namespace=BROKER_ON_SUBSCRIBER_ADDED, using=namespace)
+        # Notified outside the lock so notify subscribers never run under it.
+        flags = self._notify_flags & _NOTIFY_ON_REGISTER
+        if not flags or namespace.startswith(_NOTIFY_NAMESPACE_ROOT):
+            return
+        if created and flags & _NOTIFY_ON_NEW_NAMESPACE:
+            self._notify(BROKER_ON_NAMESPACE_CREATED, namespace)
+        if flags & _NOTIFY_ON_SUBSCRIBE:
+            self._notify(BROKER_ON_SUBSCRIBER_ADDED, namespace)
 
     def unregister_subscriber(self, namespace: str, callback: CALLBACK) -> None:
         """
@@ -300,65 +1176,77 @@ class Broker(ModuleType):
             namespace is removed from consolidation. Notify emits the used
             namespace.
         """
-        if namespace in _SUBSCRIBERS:
-            _SUBSCRIBERS[namespace] = [
-                sub for sub in _SUBSCRIBERS[namespace] if sub.callback != callback
-            ]
-            if (
-                not namespace.startswith(_NOTIFY_NAMESPACE_ROOT)
-                and self.notify_on_unsubscribe
-            ):
-                self.emit(namespace=BROKER_ON_SUBSCRIBER_REMOVED, using=namespace)
-
-            if not _SUBSCRIBERS[namespace]:
+        with _REGISTRY_LOCK:
+            subscribers = _SUBSCRIBERS.get(namespace)
+            if subscribers is None:
+                return
+
+            remaining = tuple(sub for sub in subscribers if sub.callback != callback)
+            # Unknown callbacks leave the tables, and every cache built from
+            # them, untouched.
+            if len(remaining) != len(subscribers):
+                _SUBSCRIBERS[namespace] = remaining
+                _SYNC_SUBSCRIBERS[namespace] = tuple(
+                    sub for sub in remaining if not sub.is_async
+                )
+                _bump_registry_generation()
+
+            deleted = not remaining
+            if deleted:
                 del _SUBSCRIBERS[namespace]
+                del _SYNC_SUBSCRIBERS[namespace]
+                _trie_remove(namespace)
 
                 # Clean up signature tracking if no subscribers left
-                if namespace in _NAMESPACE_SIGNATURES:
-                    del _NAMESPACE_SIGNATURES[namespace]
-
-                if (
-                    not namespace.startswith(_NOTIFY_NAMESPACE_ROOT)
-                    and self.notify_on_del_namespace
-                ):
-                    self.emit(namespace=BROKER_ON_NAMESPACE_DELETED, using=namespace)
-
-    @staticmethod
-    def _validate_emit_args(namespace: str, kwargs: dict[str, Any]) -> None:
+                _NAMESPACE_SIGNATURES.pop(namespace, None)
+                _STRICT_NAMESPACES.discard(namespace)
+                _bump_registry_generation()
+
+        # Notified outside the lock so notify subscribers never run under it.
+        flags = self._notify_flags & _NOTIFY_ON_UNREGISTER
+        if not flags or namespace.startswith(_NOTIFY_NAMESPACE_ROOT):
+            return
+        if flags & _NOTIFY_ON_UNSUBSCRIBE:
+            self._notify(BROKER_ON_SUBSCRIBER_REMOVED, namespace)
+        if deleted and flags & _NOTIFY_ON_DEL_NAMESPACE:
+            self._notify(BROKER_ON_NAMESPACE_DELETED, namespace)
+
+    def _notify(self, notify_namespace: str, namespace: str) -> None:
         """
-        Validate that emit arguments match subscriber signatures.
+        Send a notify event about a namespace to its sync subscribers.
+
+        Notify events always carry exactly using=namespace, so unlike emit()
+        their arguments are not validated and they never notify in turn.
 
         Args:
-            namespace (str): The namespace being emitted to.
-            kwargs (dict[str, Any]): The keyword arguments being emitted.
-        Raises:
-            EmitArgumentError: If provided kwargs don't match subscriber signatures.
+            notify_namespace (str): The BROKER_ON_* namespace to notify.
+            namespace (str): The namespace the broker activity concerned.
         """
-        provided_args = set(kwargs.keys())
-
-        matching_namespaces = []
-        for sub_namespace in _SUBSCRIBERS.keys():
-            if Broker._matches(namespace, sub_namespace):
-                matching_namespaces.append(sub_namespace)
-
-        for sub_namespace in matching_namespaces:
-            expected_params = _NAMESPACE_SIGNATURES.get(sub_namespace)
-
-            if expected_params is None:  # **kwargs not validated
+        _, matched, sync_subscribers, _ = _resolve(notify_namespace)
+        if not matched:
+            return
+
+        kwargs = None
+        for subscriber in sync_subscribers:
+            callback = subscriber.weak_callback()
+            if callback is None:
                 continue
 
-            if provided_args != expected_params:
-                raise EmitArgumentError(
-                    f"Argument mismatch when emitting to '{namespace}'. "
-                    f"Subscribers in '{sub_namespace}' expect: {sorted(expected_params)}, "
-                    f"but got: {sorted(provided_args)}"
-                )
+            if subscriber.positional is None and not subscriber.raw:
+                # The one known keyword is passed directly, which skips
+                # unpacking kwargs into a new dict for every call.
+                callback(using=namespace)
+            else:
+                if kwargs is None:
+                    kwargs = {"using": namespace}
+                _invoke(notify_namespace, subscriber, callback, kwargs, None)
 
     def emit(self, namespace: str, **kwargs: Any) -> None:
         """
         Emit an event to all matching synchronous subscribers.
 
-        Synchronous subscribers are called immediately in priority order.
+        Synchronous subscribers are called immediately in priority order,
+        across exact and wildcard subscriptions alike.
         Asynchronous subscribers are NOT called - they are skipped entirely.
 
         Use emit_async() if you need to call async subscribers or await their
@@ -375,21 +1263,19 @@ class Broker(ModuleType):
             -Emits a notify event after args have been sent to subscribers.
             Notify emits the used namespace.
         """
-        self._validate_emit_args(namespace, kwargs)
+        # Nothing to validate or call when no namespace matches.
+        generation, matched, sync_subscribers, _ = _resolve(namespace)
+        if matched:
+            if _STRICT_NAMESPACES:
+                _validate_emit_args(namespace, kwargs, matched, generation)
 
-        for sub_namespace, subscribers in _SUBSCRIBERS.items():
-            if self._matches(namespace, sub_namespace):
-                sorted_subscribers = sorted(
-                    subscribers, key=lambda s: s.priority, reverse=True
-                )
-                for subscriber in sorted_subscribers:
-                    if not subscriber.is_async:  # Only call sync callbacks
-                        subscriber.callback(**kwargs)
+            _call_sync(namespace, sync_subscribers, kwargs)
 
-        if not namespace.startswith(_NOTIFY_NAMESPACE_ROOT) and (
-            self.notify_on_emit or self.notify_on_emit_all
+        # Flags first, they are usually off.
+        if self._notify_flags & _NOTIFY_ON_ANY_EMIT and not namespace.startswith(
+            _NOTIFY_NAMESPACE_ROOT
         ):
-            self.emit(namespace=BROKER_ON_EMIT, using=namespace)
+            self._notify(BROKER_ON_EMIT, namespace)
 
     async def emit_async(self, namespace: str, **kwargs: Any) -> None:
         """
@@ -397,7 +1283,8 @@ class Broker(ModuleType):
 
         Both synchronous and asynchronous subscribers are called in priority order.
         - Synchronous subscribers are executed immediately.
-        - Asynchronous subscribers are awaited sequentially.
+        - Asynchronous subscribers sharing a priority are awaited concurrently,
+        each priority level completes before the next one starts.
 
         This method must be awaited. Execution blocks until all subscribers complete.
         Use emit() for fire-and-forget behavior with sync-only subscribers.
@@ -414,47 +1301,217 @@ class Broker(ModuleType):
             -Emits a notify event after args have been sent to subscribers.
             Notify emits the used namespace.
         """
-        self._validate_emit_args(namespace, kwargs)
+        generation, matched, _, subscribers = _resolve(namespace)
+        if matched:
+            if _STRICT_NAMESPACES:
+                _validate_emit_args(namespace, kwargs, matched, generation)
+
+            built = _positional_cache()
+            levels = itertools.groupby(subscribers, key=_priority)
+            for _, level in levels:
+                coroutines = []
+                try:
+                    for subscriber in level:
+                        callback = subscriber.weak_callback()
+                        if callback is None:
+                            continue
+
+                        result = _invoke(namespace, subscriber, callback, kwargs, built)
+                        if subscriber.is_async:
+                            coroutines.append(result)
+                except BaseException:
+                    # Coroutines of the level created before the failure will
+                    # never be awaited, close them so none leaks unawaited.
+                    for coroutine in coroutines:
+                        coroutine.close()
+                    raise
+
+                if len(coroutines) == 1:
+                    await coroutines[0]
+                elif coroutines:
+                    await asyncio.gather(*coroutines)
+
+        if self._notify_flags & _NOTIFY_ON_ANY_EMIT_ASYNC and not namespace.startswith(
+            _NOTIFY_NAMESPACE_ROOT
+        ):
+            self._notify(BROKER_ON_EMIT_ASYNC, namespace)
 
-        for sub_namespace, subscribers in _SUBSCRIBERS.items():
-            if self._matches(namespace, sub_namespace):
-                sorted_subscribers = sorted(
-                    subscribers, key=lambda s: s.priority, reverse=True
-                )
-                for subscriber in sorted_subscribers:
-                    if subscriber.is_async:
-                        await subscriber.callback(**kwargs)
-                    else:
-                        subscriber.callback(**kwargs)
-
-        if not namespace.startswith(_NOTIFY_NAMESPACE_ROOT) and (
-            self.notify_on_emit_async or self.notify_on_emit_all
+    def emit_async_nowait(self, namespace: str, **kwargs: Any) -> asyncio.Task:
+        """
+        Schedule emit_async() as a task on the running event loop.
+
+        Unlike emit_nowait(), sync subscribers run inside the task as well and
+        each priority level still completes before the next one starts.
+
+        Args:
+            namespace (str): Event namespace (e.g., 'system.io.file_open').
+            **kwargs (Any): Arguments to pass to subscriber callbacks.
+        Returns:
+            asyncio.Task: The scheduled emit. Awaiting it raises any
+                EmitArgumentError or subscriber exception.
+        Raises:
+            RuntimeError: If there is no running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return _schedule(loop, self.emit_async(namespace, **kwargs))
+
+    def emit_nowait(self, namespace: str, **kwargs: Any) -> list[asyncio.Task]:
+        """
+        Emit an event to all matching subscribers without awaiting async ones.
+
+        Synchronous subscribers are called immediately in priority order.
+        Asynchronous subscribers are scheduled as tasks on the running event
+        loop in the same order and start once the caller yields to the loop.
+        With enable_eager_tasks() they instead start immediately, running
+        until their first suspension before emit_nowait() continues.
+        Without a running loop async subscribers are skipped, as in emit().
+
+        Args:
+            namespace (str): Event namespace (e.g., 'system.io.file_open').
+            **kwargs (Any): Arguments to pass to subscriber callbacks.
+        Returns:
+            list[asyncio.Task]: The tasks scheduled for async subscribers.
+        Raises:
+            EmitArgumentError: If provided kwargs don't match subscriber
+                signatures.
+        Note:
+            -Priority only orders when async subscribers are scheduled, they
+            may complete in any order. Await the returned tasks if needed.
+            -Use set_backlog() to bound how many tasks a namespace's
+            subscribers may have pending.
+            -Emits a notify event after args have been sent to subscribers.
+            Notify emits the used namespace.
+        """
+        tasks = []
+
+        generation, matched, _, subscribers = _resolve(namespace)
+        if matched:
+            if _STRICT_NAMESPACES:
+                _validate_emit_args(namespace, kwargs, matched, generation)
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+            built = _positional_cache()
+            for subscriber in subscribers:
+                callback = subscriber.weak_callback()
+                if callback is None:
+                    continue
+
+                backlog = None
+                if subscriber.is_async:
+                    if loop is None:
+                        continue
+                    backlog = _BACKLOGS.get(subscriber.namespace)
+                    if backlog is not None and not backlog.admit():
+                        continue
+
+                result = _invoke(namespace, subscriber, callback, kwargs, built)
+                if subscriber.is_async:
+                    task = _schedule(loop, result)
+                    if backlog is not None:
+                        backlog.track(task)
+                    tasks.append(task)
+
+        if self._notify_flags & _NOTIFY_ON_ANY_EMIT and not namespace.startswith(
+            _NOTIFY_NAMESPACE_ROOT
         ):
-            self.emit(namespace=BROKER_ON_EMIT_ASYNC, using=namespace)
+            self._notify(BROKER_ON_EMIT, namespace)
+
+        return tasks
 
     @staticmethod
-    def _matches(event_namespace: str, subscriber_namespace: str) -> bool:
+    def set_backlog(
+        namespace: str, maxsize: Optional[int], policy: str = BACKLOG_DROP_NEWEST
+    ) -> None:
         """
-        Check if an event namespace matches a subscriber namespace.
+        Bound the tasks emit_nowait() may have pending for a namespace.
+
+        Async subscribers of the namespace share the limit. Once it is
+        reached the policy decides whether the new callback is skipped,
+        BACKLOG_DROP_NEWEST, or the oldest pending task is cancelled to make
+        room, BACKLOG_DROP_OLDEST.
 
         Args:
-            event_namespace (str): The namespace where event was emitted.
-            subscriber_namespace (str): The namespace a subscriber registered
-                for.
+            namespace (str): The subscriber namespace, as registered
+                (e.g., 'system.io.file_open' or 'system.*').
+            maxsize (Optional[int]): The most pending tasks allowed, or None
+                to remove the limit.
+            policy (str): The overflow policy. Defaults to BACKLOG_DROP_NEWEST.
+        Raises:
+            ValueError: If maxsize is below 1 or the policy is unknown.
+        Notes:
+            emit() and emit_async() are not limited, emit_async() already
+            waits for every callback it starts.
+        """
+        if maxsize is None:
+            _BACKLOGS.pop(namespace, None)
+            return
+        if maxsize < 1:
+            raise ValueError(f"Backlog maxsize must be at least 1, got {maxsize}")
+        if policy not in (BACKLOG_DROP_NEWEST, BACKLOG_DROP_OLDEST):
+            raise ValueError(f"Unknown backlog policy: {policy!r}")
+
+        backlog = _BACKLOGS.get(namespace)
+        if backlog is None:
+            _BACKLOGS[_intern(namespace)] = _Backlog(maxsize, policy)
+        else:
+            # Keep counting the tasks already pending.
+            backlog.maxsize = maxsize
+            backlog.policy = policy
+
+    @staticmethod
+    def set_deduplicate(enabled: bool = True) -> None:
+        """
+        Set whether a callback subscribed through several namespaces matching
+        one emit is called once or once per subscription.
+
+        When enabled the callback runs once, at its highest priority
+        subscription, e.g. a callback subscribed to both 'system.*' and
+        'system.io.file_open' runs once when 'system.io.file_open' is
+        emitted. Disabled by default, and again after clear().
+
+        Args:
+            enabled (bool): Whether to deduplicate callbacks. Defaults to True.
+        Notes:
+            Duplicates are removed when an emitted namespace is resolved, which
+            is cached, so enabling this adds no cost per emit.
+        """
+        global _DEDUPLICATE
+        with _REGISTRY_LOCK:
+            _DEDUPLICATE = enabled
+            _bump_registry_generation()
+
+    @staticmethod
+    def enable_eager_tasks(loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+        """
+        Install asyncio's eager task factory on an event loop.
+
+        emit_async() gathers async subscribers sharing a priority as tasks.
+        With eager tasks, subscribers that finish without suspending (logging,
+        metrics, etc.) complete inline instead of being scheduled on the loop.
+
+        Args:
+            loop (Optional[asyncio.AbstractEventLoop]): The loop to configure.
+                Defaults to the running loop.
         Returns:
-            bool: True if subscriber should receive the event.
+            bool: True if the factory was installed, False if this Python
+                version (before 3.12) has no eager task factory.
+        Raises:
+            RuntimeError: If no loop is given and there is no running event
+                loop.
         """
-        if event_namespace == subscriber_namespace:
-            return True
+        factory = getattr(asyncio, "eager_task_factory", None)
+        if factory is None:
+            return False
 
-        # Wildcard match - subscriber wants all events under a root
-        if subscriber_namespace.endswith(".*"):
-            # Although not strictly necessary to remove . and *, doing so adds
-            # slightly more validity to the check.
-            root = subscriber_namespace[:-2]
-            return event_namespace.startswith(root + ".")
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        loop.set_task_factory(factory)
 
-        return False
+        return True
 
     def set_flag_sates(
         self,
@@ -481,24 +1538,29 @@ class Broker(ModuleType):
             on_new_namespace: 	if True, get notified whenever a new namespace is created;
             on_del_namespace:	if True, get notified whenever a namespace is "deleted";
         """
-        self.notify_on_subscribe = on_subscribe
-        self.notify_on_unsubscribe = on_unsubscribe
-        self.notify_on_collected = on_collected
-        self.notify_on_emit = on_emit
-        self.notify_on_emit_async = on_emit_async
-        self.notify_on_emit_all = on_emit_all
-        self.notify_on_new_namespace = on_new_namespace
-        self.notify_on_del_namespace = on_del_namespace
+        self._notify_flags = (
+            (_NOTIFY_ON_SUBSCRIBE if on_subscribe else 0)
+            | (_NOTIFY_ON_UNSUBSCRIBE if on_unsubscribe else 0)
+            | (_NOTIFY_ON_COLLECTED if on_collected else 0)
+            | (_NOTIFY_ON_EMIT if on_emit else 0)
+            | (_NOTIFY_ON_EMIT_ASYNC if on_emit_async else 0)
+            | (_NOTIFY_ON_EMIT_ALL if on_emit_all else 0)
+            | (_NOTIFY_ON_NEW_NAMESPACE if on_new_namespace else 0)
+            | (_NOTIFY_ON_DEL_NAMESPACE if on_del_namespace else 0)
+        )
 
     @staticmethod
     def to_string() -> str:
         """Returns a string representation of the broker."""
-        keys = sorted(_SUBSCRIBERS.keys())
-        data = {}
+        # Written out directly in json.dumps(data, indent=4) layout, as the
+        # indenting encoder is pure python. Each string is still escaped by
+        # json's C encoder.
+        encode = json.dumps
+        entries = []
 
-        for namespace in keys:
+        for namespace, subscribers in sorted(_SUBSCRIBERS.items()):
             subscribers_info = []
-            for sub in _SUBSCRIBERS[namespace]:
+            for sub in subscribers:
                 # Get live callback (or None if collected)
                 callback = sub.callback
 
@@ -526,11 +1588,22 @@ class Broker(ModuleType):
                     f" [priority={sub.priority}]" if sub.priority != 0 else ""
                 )
                 async_str = " [async]" if sub.is_async else ""
-                subscribers_info.append(f"{info}{priority_str}{async_str}")
+                call_str = " [raw]" if sub.raw else ""
+                if sub.positional is not None:
+                    call_str = f" [positional={','.join(sub.positional)}]"
+                subscribers_info.append(f"{info}{priority_str}{async_str}{call_str}")
 
-            data[namespace] = subscribers_info
+            if subscribers_info:
+                items = ",\n".join(f"        {encode(i)}" for i in subscribers_info)
+                entries.append(f"    {encode(namespace)}: [\n{items}\n    ]")
+            else:
+                entries.append(f"    {encode(namespace)}: []")
 
-        return json.dumps(data, indent=4)
+        if not entries:
+            return "{}"
+
+        body = ",\n".join(entries)
+        return f"{{\n{body}\n}}"
 
 
 # This is here to protect the _SUBSCRIBERS dict, creating a protective closure.
@@ -551,7 +1624,13 @@ def clear() -> None:
 
 
 # noinspection PyUnusedLocal
-def register_subscriber(namespace: str, callback: CALLBACK, priority: int = 0) -> None:
+def register_subscriber(
+    namespace: str,
+    callback: CALLBACK,
+    priority: int = 0,
+    raw: bool = False,
+    positional: Optional[Iterable[str]] = None,
+) -> None:
     """See docstring above..."""
 
 
@@ -571,10 +1650,42 @@ async def emit_async(namespace: str, **kwargs: Any) -> None:
 
 
 # noinspection PyUnusedLocal
-def subscribe(namespace: str, priority: int = 0) -> CALLBACK:
+def emit_async_nowait(namespace: str, **kwargs: Any) -> asyncio.Task:
+    """See docstring above..."""
+
+
+# noinspection PyUnusedLocal
+def emit_nowait(namespace: str, **kwargs: Any) -> list[asyncio.Task]:
+    """See docstring above..."""
+
+
+# noinspection PyUnusedLocal
+def subscribe(
+    namespace: str,
+    priority: int = 0,
+    raw: bool = False,
+    positional: Optional[Iterable[str]] = None,
+) -> CALLBACK:
     """See docstring for subscribe_ above..."""
 
 
+# noinspection PyUnusedLocal
+def set_backlog(
+    namespace: str, maxsize: Optional[int], policy: str = BACKLOG_DROP_NEWEST
+) -> None:
+    """See docstring above..."""
+
+
+# noinspection PyUnusedLocal
+def set_deduplicate(enabled: bool = True) -> None:
+    """See docstring above..."""
+
+
+# noinspection PyUnusedLocal
+def enable_eager_tasks(loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+    """See docstring above..."""
+
+
 # noinspection PyUnusedLocal
 def set_flag_sates(
     on_subscribe: bool = False,
@@ -139,3 +139,130 @@ def test_kwargs_callback_accepts_any_emit() -> None:
     assert received["foo"] == "bar"
     assert received["count"] == 42
     assert received["active"] is True
+
+
+def test_emit_validation_follows_new_subscribers() -> None:
+    """
+    Test that emit validation picks up subscribers registered after the
+    namespace was already emitted to.
+    """
+    broker.clear()
+
+    # noinspection PyUnusedLocal
+    def flexible_callback(**kwargs: object) -> None:
+        pass
+
+    # noinspection PyUnusedLocal
+    def strict_callback(filename: str) -> None:
+        pass
+
+    broker.register_subscriber("file.save", flexible_callback)
+    broker.emit("file.save", path="test.txt")
+
+    broker.register_subscriber("file.*", strict_callback)
+    with pytest.raises(EmitArgumentError, match="Argument mismatch"):
+        broker.emit("file.save", path="test.txt")
+
+    broker.unregister_subscriber("file.*", strict_callback)
+    broker.emit("file.save", path="test.txt")
+
+
+def test_emit_argument_error_details() -> None:
+    """Test that EmitArgumentError exposes the mismatch it describes."""
+    broker.clear()
+
+    # noinspection PyUnusedLocal
+    def callback(filename: str) -> None:
+        pass
+
+    broker.register_subscriber("file.*", callback)
+
+    with pytest.raises(EmitArgumentError) as error:
+        broker.emit("file.save", path="test.txt")
+
+    assert error.value.namespace == "file.save"
+    assert error.value.sub_namespace == "file.*"
+    assert error.value.expected == {"filename"}
+    assert error.value.provided == {"path"}
+    assert "expect: ['filename'], but got: ['path']" in str(error.value)
+
+
+def test_emit_without_matching_subscribers_is_not_validated() -> None:
+    """
+    Test that emitting to a namespace nobody subscribes to succeeds with any
+    arguments, even while other namespaces expect specific arguments.
+    """
+    broker.clear()
+
+    # noinspection PyUnusedLocal
+    def callback(filename: str) -> None:
+        pass
+
+    broker.register_subscriber("file.save", callback)
+
+    # Act & Assert - should not raise
+    broker.emit("file.delete", path="test.txt")
+    broker.emit("network.connect", host="localhost")
+
+
+def test_signature_parameter_kinds() -> None:
+    """
+    Test that keyword-only parameters count towards a signature while *args
+    and a bound method's self do not.
+    """
+    broker.clear()
+    namespace = "file.kinds"
+
+    class Handler(object):
+        # noinspection PyUnusedLocal
+        def on_event(self, path: str, *args: object, mode: str) -> None:
+            pass
+
+    # noinspection PyUnusedLocal
+    def keyword_only(path: str, *, mode: str) -> None:
+        pass
+
+    handler = Handler()
+    broker.register_subscriber(namespace, handler.on_event)
+    broker.register_subscriber(namespace, keyword_only)
+    broker.emit(namespace, path="test.txt", mode="r")
+
+    # noinspection PyUnusedLocal
+    def with_self(self: object, path: str, mode: str) -> None:
+        pass
+
+    with pytest.raises(SignatureMismatchError):
+        broker.register_subscriber(namespace, with_self)
+
+
+def test_validation_follows_registration_during_resolve(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that a subscriber registered between resolving and validating an
+    emit is validated by every later emit.
+    """
+    broker.clear()
+    # The closure's globals, reached through a broker function.
+    module_globals = broker.register_subscriber.__func__.__globals__
+    resolve = module_globals["_resolve"]
+
+    # noinspection PyUnusedLocal
+    def exact(path: int) -> None:
+        pass
+
+    def strict() -> None:
+        pass
+
+    def resolve_then_register(namespace: str):  # type: ignore[no-untyped-def]
+        resolved = resolve(namespace)
+        monkeypatch.setitem(module_globals, "_resolve", resolve)
+        broker.register_subscriber("a.*", strict)
+        return resolved
+
+    broker.register_subscriber("a.b", exact)
+    monkeypatch.setitem(module_globals, "_resolve", resolve_then_register)
+    broker.emit("a.b", path=1)
+
+    with pytest.raises(EmitArgumentError):
+        broker.emit("a.b", path=1)
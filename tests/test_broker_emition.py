@@ -1,5 +1,11 @@
+import asyncio
+import gc
+import warnings
+from enum import Enum
 from typing import Any
 
+import pytest
+
 import broker
 
 
@@ -85,3 +91,520 @@ def test_callbacks_execute_in_priority_order() -> None:
 
     # Assert - should execute in priority order (high to low)
     assert execution_order == ["high", "medium", "low"]
+
+
+def test_wildcard_matches_nested_namespaces_only() -> None:
+    """
+    Test that a wildcard subscriber receives events at any depth below its root
+    but not events emitted to the root itself or to sibling roots.
+    """
+    broker.clear()
+    received: list[str] = []
+
+    def wildcard_callback(name: str) -> None:
+        received.append(name)
+
+    broker.register_subscriber("system.*", wildcard_callback)
+    broker.emit("system.io.file.open", name="nested")
+    broker.emit("system", name="root")
+    broker.emit("systems.io", name="sibling")
+
+    assert received == ["nested"]
+
+
+def test_equal_priorities_execute_in_registration_order() -> None:
+    """Test that callbacks sharing a priority execute in registration order."""
+    broker.clear()
+    namespace = "system.test"
+    execution_order: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def first_callback(**kwargs: Any) -> None:
+        execution_order.append("first")
+
+    # noinspection PyUnusedLocal
+    def second_callback(**kwargs: Any) -> None:
+        execution_order.append("second")
+
+    # noinspection PyUnusedLocal
+    def urgent_callback(**kwargs: Any) -> None:
+        execution_order.append("urgent")
+
+    broker.register_subscriber(namespace, first_callback, priority=1)
+    broker.register_subscriber(namespace, second_callback, priority=1)
+    broker.register_subscriber(namespace, urgent_callback, priority=5)
+    broker.emit(namespace)
+
+    assert execution_order == ["urgent", "first", "second"]
+
+
+def test_priority_order_spans_wildcard_and_exact_subscribers() -> None:
+    """
+    Test that priority order applies across wildcard and exact subscribers
+    matching the same event.
+    """
+    broker.clear()
+    execution_order: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def wildcard_low(**kwargs: Any) -> None:
+        execution_order.append("wildcard_low")
+
+    # noinspection PyUnusedLocal
+    def exact_high(**kwargs: Any) -> None:
+        execution_order.append("exact_high")
+
+    # noinspection PyUnusedLocal
+    def wildcard_highest(**kwargs: Any) -> None:
+        execution_order.append("wildcard_highest")
+
+    broker.register_subscriber("system.*", wildcard_low, priority=1)
+    broker.register_subscriber("system.io.save", exact_high, priority=5)
+    broker.register_subscriber("system.io.*", wildcard_highest, priority=10)
+    broker.emit("system.io.save")
+
+    assert execution_order == ["wildcard_highest", "exact_high", "wildcard_low"]
+
+
+def test_equal_priorities_keep_registration_order_across_namespaces() -> None:
+    """
+    Test that equal priority subscribers of different matching namespaces run
+    in the order they were registered.
+    """
+    broker.clear()
+    execution_order: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def exact(**kwargs: Any) -> None:
+        execution_order.append("exact")
+
+    # noinspection PyUnusedLocal
+    def wildcard(**kwargs: Any) -> None:
+        execution_order.append("wildcard")
+
+    # noinspection PyUnusedLocal
+    def late_exact(**kwargs: Any) -> None:
+        execution_order.append("late_exact")
+
+    broker.register_subscriber("a.b", exact)
+    broker.register_subscriber("a.*", wildcard)
+    broker.register_subscriber("a.b", late_exact)
+    broker.emit("a.b")
+    asyncio.run(broker.emit_async("a.b"))
+
+    assert execution_order == ["exact", "wildcard", "late_exact"] * 2
+
+
+def test_emit_async_gathers_equal_priority_subscribers() -> None:
+    """
+    Test that async subscribers sharing a priority run concurrently while
+    lower priorities wait for higher priorities to finish.
+    """
+    broker.clear()
+    events: list[str] = []
+
+    # noinspection PyUnusedLocal
+    async def first(**kwargs: Any) -> None:
+        events.append("first_start")
+        await asyncio.sleep(0)
+        events.append("first_end")
+
+    # noinspection PyUnusedLocal
+    async def second(**kwargs: Any) -> None:
+        events.append("second_start")
+        await asyncio.sleep(0)
+        events.append("second_end")
+
+    # noinspection PyUnusedLocal
+    async def last(**kwargs: Any) -> None:
+        events.append("last")
+
+    broker.register_subscriber("test.async", first, priority=5)
+    broker.register_subscriber("test.async", second, priority=5)
+    broker.register_subscriber("test.async", last, priority=1)
+    asyncio.run(broker.emit_async("test.async"))
+
+    assert events == [
+        "first_start",
+        "second_start",
+        "first_end",
+        "second_end",
+        "last",
+    ]
+
+
+def test_emit_async_closes_coroutines_when_a_level_raises() -> None:
+    """
+    Test that a sync subscriber raising in emit_async leaves no coroutine of
+    its priority level unawaited.
+    """
+    broker.clear()
+
+    # noinspection PyUnusedLocal
+    async def async_callback(**kwargs: Any) -> None:
+        pass
+
+    # noinspection PyUnusedLocal
+    def failing_callback(**kwargs: Any) -> None:
+        raise RuntimeError("failed")
+
+    broker.register_subscriber("test.async.raise", async_callback, priority=1)
+    broker.register_subscriber("test.async.raise", failing_callback, priority=1)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with pytest.raises(RuntimeError):
+            asyncio.run(broker.emit_async("test.async.raise"))
+        gc.collect()
+
+    assert not [w for w in caught if "never awaited" in str(w.message)]
+
+
+def test_enable_eager_tasks_keeps_emit_async_behavior() -> None:
+    """
+    Test that installing the eager task factory, where available, does not
+    change which subscribers emit_async() calls.
+    """
+    broker.clear()
+    invoked: list[str] = []
+
+    async def first(data: str) -> None:
+        invoked.append(f"first: {data}")
+
+    async def second(data: str) -> None:
+        await asyncio.sleep(0)
+        invoked.append(f"second: {data}")
+
+    broker.register_subscriber("test.eager", first)
+    broker.register_subscriber("test.eager", second)
+
+    async def main() -> bool:
+        installed = broker.enable_eager_tasks()
+        await broker.emit_async("test.eager", data="test")
+        return installed
+
+    installed = asyncio.run(main())
+
+    assert installed == hasattr(asyncio, "eager_task_factory")
+    assert sorted(invoked) == ["first: test", "second: test"]
+
+
+def test_registering_during_emit_does_not_affect_current_dispatch() -> None:
+    """
+    Test that a subscriber registered by a callback during an emit is not
+    called by that emit and does not cause other callbacks to run twice.
+    """
+    broker.clear()
+    namespace = "test.reentrant"
+    execution_order: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def late_callback(**kwargs: Any) -> None:
+        execution_order.append("late")
+
+    # noinspection PyUnusedLocal
+    def registering_callback(**kwargs: Any) -> None:
+        execution_order.append("registering")
+        broker.register_subscriber(namespace, late_callback, priority=20)
+
+    # noinspection PyUnusedLocal
+    def other_callback(**kwargs: Any) -> None:
+        execution_order.append("other")
+
+    broker.register_subscriber(namespace, registering_callback, priority=10)
+    broker.register_subscriber(namespace, other_callback, priority=1)
+    broker.emit(namespace)
+
+    assert execution_order == ["registering", "other"]
+
+
+def test_repeated_emits_follow_subscription_changes() -> None:
+    """
+    Test that repeated emits to the same namespace pick up subscribers added
+    or removed between them.
+    """
+    broker.clear()
+    namespace = "test.repeated.event"
+    received: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def exact_callback(**kwargs: Any) -> None:
+        received.append("exact")
+
+    # noinspection PyUnusedLocal
+    def wildcard_callback(**kwargs: Any) -> None:
+        received.append("wildcard")
+
+    broker.register_subscriber(namespace, exact_callback)
+    broker.emit(namespace)
+    broker.register_subscriber("test.*", wildcard_callback, priority=5)
+    broker.emit(namespace)
+    broker.unregister_subscriber(namespace, exact_callback)
+    broker.emit(namespace)
+
+    assert received == ["exact", "wildcard", "exact", "wildcard"]
+
+
+def test_unmatched_emits_reach_later_subscribers() -> None:
+    """
+    Test that emitting to namespaces nothing matches, with and without
+    wildcards registered, does not stop later subscribers receiving them.
+    """
+    broker.clear()
+    received: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def callback(**kwargs: Any) -> None:
+        received.append("called")
+
+    broker.emit("other.event")
+    broker.register_subscriber("test.*", callback)
+    broker.emit("other.event")
+    broker.emit("other.nested.event")
+    broker.register_subscriber("other.event", callback)
+    broker.register_subscriber("other.nested.*", callback)
+    broker.emit("other.event")
+    broker.emit("other.nested.event")
+
+    assert received == ["called", "called"]
+
+
+def test_raw_subscriber_receives_kwargs_dict() -> None:
+    """
+    Test that a raw subscriber receives the emitted kwargs as one dict,
+    alongside regular subscribers, from both emit and emit_async.
+    """
+    broker.clear()
+    namespace = "test.raw"
+    received: list[Any] = []
+
+    def raw_callback(payload: dict[str, Any]) -> None:
+        received.append(payload)
+
+    def regular_callback(value: int) -> None:
+        received.append(value)
+
+    broker.register_subscriber(namespace, raw_callback, priority=1, raw=True)
+    broker.register_subscriber(namespace, regular_callback)
+    broker.emit(namespace, value=1)
+    asyncio.run(broker.emit_async(namespace, value=2))
+
+    assert received == [{"value": 1}, 1, {"value": 2}, 2]
+
+
+def test_emit_nowait_schedules_async_subscribers() -> None:
+    """
+    Test that emit_nowait calls sync subscribers immediately and schedules
+    async subscribers on the running loop, skipping them without one.
+    """
+    broker.clear()
+    namespace = "test.nowait"
+    invoked: list[str] = []
+
+    async def async_callback(data: str) -> None:
+        invoked.append(f"async: {data}")
+
+    def sync_callback(data: str) -> None:
+        invoked.append(f"sync: {data}")
+
+    broker.register_subscriber(namespace, async_callback, priority=1)
+    broker.register_subscriber(namespace, sync_callback)
+
+    assert broker.emit_nowait(namespace, data="no loop") == []
+    assert invoked == ["sync: no loop"]
+    invoked.clear()
+
+    async def main() -> None:
+        tasks = broker.emit_nowait(namespace, data="loop")
+        assert len(tasks) == 1
+        assert invoked == ["sync: loop"]
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+    assert invoked == ["sync: loop", "async: loop"]
+
+
+def test_backlog_policies_bound_pending_tasks() -> None:
+    """
+    Test that set_backlog limits the pending emit_nowait tasks, skipping the
+    newest or cancelling the oldest callback once full.
+    """
+    broker.clear()
+    finished: list[int] = []
+
+    async def slow_callback(value: int) -> None:
+        await asyncio.sleep(0)
+        finished.append(value)
+
+    broker.register_subscriber("test.backlog.newest", slow_callback)
+    broker.register_subscriber("test.backlog.oldest", slow_callback)
+    broker.set_backlog("test.backlog.newest", 2)
+    broker.set_backlog("test.backlog.oldest", 2, broker.BACKLOG_DROP_OLDEST)
+
+    with pytest.raises(ValueError):
+        broker.set_backlog("test.backlog.newest", 0)
+
+    async def main(namespace: str) -> None:
+        tasks = []
+        for value in range(4):
+            tasks.extend(broker.emit_nowait(namespace, value=value))
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main("test.backlog.newest"))
+    assert finished == [0, 1]
+
+    finished.clear()
+    asyncio.run(main("test.backlog.oldest"))
+    assert finished == [2, 3]
+
+
+class _Topic(str, Enum):
+    BACKLOG = "test.backlog.enum"
+
+
+def test_backlog_accepts_str_enum_namespaces() -> None:
+    """Test that set_backlog accepts str enum namespaces."""
+    broker.clear()
+    finished: list[int] = []
+
+    async def slow_callback(value: int) -> None:
+        await asyncio.sleep(0)
+        finished.append(value)
+
+    broker.register_subscriber(_Topic.BACKLOG, slow_callback)
+    broker.set_backlog(_Topic.BACKLOG, 1)
+
+    async def main() -> None:
+        tasks = []
+        for value in range(3):
+            tasks.extend(broker.emit_nowait(_Topic.BACKLOG, value=value))
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert finished == [0]
+
+
+def test_positional_subscribers_receive_ordered_arguments() -> None:
+    """
+    Test that positional subscribers receive the named kwargs positionally,
+    in their own order, and that missing kwargs are reported.
+    """
+    broker.clear()
+    namespace = "test.positional"
+    received: list[tuple[Any, ...]] = []
+
+    def forward(path: str, size: int) -> None:
+        received.append((path, size))
+
+    def backward(size: int, path: str) -> None:
+        received.append((size, path))
+
+    broker.register_subscriber(namespace, forward, 2, positional=("path", "size"))
+    broker.register_subscriber(namespace, backward, 1, positional=("size", "path"))
+    broker.emit(namespace, path="a.txt", size=3)
+
+    assert received == [("a.txt", 3), (3, "a.txt")]
+
+    with pytest.raises(broker.EmitArgumentError):
+        broker.emit(namespace, path="a.txt")
+
+    with pytest.raises(ValueError):
+        broker.register_subscriber(namespace, forward, raw=True, positional=["path"])
+
+
+class _Field(str, Enum):
+    PATH = "path"
+    SIZE = "size"
+
+
+def test_positional_names_accept_str_enums() -> None:
+    """Test that positional argument names may be str enum members."""
+    broker.clear()
+    received: list[tuple[Any, ...]] = []
+
+    def callback(size: int, path: str) -> None:
+        received.append((size, path))
+
+    broker.register_subscriber(
+        "test.positional", callback, positional=(_Field.SIZE, _Field.PATH)
+    )
+    broker.emit("test.positional", path="a.txt", size=3)
+
+    assert received == [(3, "a.txt")]
+
+
+def test_deduplicate_calls_callback_once_per_emit() -> None:
+    """
+    Test that with deduplication enabled a callback subscribed through both
+    a wildcard and an exact namespace is called once per emit.
+    """
+    broker.clear()
+    received: list[str] = []
+
+    def callback(**kwargs: Any) -> None:
+        received.append(kwargs["tag"])
+
+    broker.register_subscriber("test.*", callback)
+    broker.register_subscriber("test.dedup", callback)
+
+    broker.emit("test.dedup", tag="default")
+    broker.set_deduplicate()
+    try:
+        broker.emit("test.dedup", tag="deduplicated")
+    finally:
+        broker.set_deduplicate(False)
+
+    assert received == ["default", "default", "deduplicated"]
+
+
+def test_clear_turns_deduplication_off() -> None:
+    """Test that clear() resets deduplication to its disabled default."""
+    broker.clear()
+    received: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def callback(**kwargs: Any) -> None:
+        received.append("called")
+
+    broker.set_deduplicate()
+    broker.clear()
+    broker.register_subscriber("test.*", callback)
+    broker.register_subscriber("test.dedup", callback)
+    broker.emit("test.dedup")
+
+    assert received == ["called", "called"]
+
+
+def test_emit_async_nowait_runs_priority_levels_in_order() -> None:
+    """
+    Test that emit_async_nowait schedules emit_async, finishing each priority
+    level before the next, and requires a running loop.
+    """
+    broker.clear()
+    namespace = "test.async_nowait"
+    execution_order: list[str] = []
+
+    # noinspection PyUnusedLocal
+    async def slow_high(**kwargs: Any) -> None:
+        await asyncio.sleep(0.01)
+        execution_order.append("high")
+
+    # noinspection PyUnusedLocal
+    def low(**kwargs: Any) -> None:
+        execution_order.append("low")
+
+    broker.register_subscriber(namespace, slow_high, priority=10)
+    broker.register_subscriber(namespace, low)
+
+    with pytest.raises(RuntimeError):
+        broker.emit_async_nowait(namespace)
+
+    async def main() -> None:
+        task = broker.emit_async_nowait(namespace)
+        assert execution_order == []
+        await task
+
+    asyncio.run(main())
+
+    assert execution_order == ["high", "low"]
@@ -200,3 +200,97 @@ def test_multiple_notify_flags_together() -> None:
     assert "test.multiple" in subscribe_notifications
     assert "test.multiple" in namespace_notifications
     assert "test.multiple" in emit_notifications
+
+
+def test_notify_reaches_wildcard_notify_subscribers() -> None:
+    """
+    Test that notify events reach wildcard subscribers of the notify
+    namespaces alongside exact ones.
+    """
+    broker.clear()
+    broker.set_flag_sates(on_emit=True)
+    notifications: list[str] = []
+
+    @broker.subscribe("broker.notify.*")
+    def on_any_notify(using: str) -> None:
+        notifications.append(f"any: {using}")
+
+    @broker.subscribe(broker.BROKER_ON_EMIT, priority=1)
+    def on_emit(using: str) -> None:
+        notifications.append(f"emit: {using}")
+
+    # noinspection PyUnusedLocal
+    @broker.subscribe("test.event")
+    def test_callback(data: str) -> None:
+        pass
+
+    broker.emit("test.event", data="test")
+    broker.set_flag_sates()
+
+    assert notifications == ["emit: test.event", "any: test.event"]
+
+
+def test_notify_flag_attributes_follow_set_flag_sates() -> None:
+    """
+    Test that the notify_on_* attributes reflect set_flag_sates() and that
+    setting one directly toggles its notifications.
+    """
+    broker.clear()
+    broker.set_flag_sates(on_subscribe=True, on_emit_all=True)
+    notifications: list[str] = []
+
+    assert broker.notify_on_subscribe
+    assert broker.notify_on_emit_all
+    assert not broker.notify_on_emit
+
+    @broker.subscribe(broker.BROKER_ON_EMIT)
+    def on_emit(using: str) -> None:
+        notifications.append(using)
+
+    broker.notify_on_emit_all = False
+    broker.emit("test.event")
+    assert notifications == []
+
+    broker.notify_on_emit = True
+    broker.emit("test.event")
+    broker.set_flag_sates()
+
+    assert notifications == ["test.event"]
+    assert not broker.notify_on_emit
+
+    # Flags follow truthiness, like plain attributes did.
+    broker.set_flag_sates(on_emit=None, on_subscribe=1)  # type: ignore[arg-type]
+    assert not broker.notify_on_emit
+    assert broker.notify_on_subscribe
+    broker.set_flag_sates()
+
+
+def test_notify_reaches_every_subscriber_style() -> None:
+    """
+    Test that notify events pass using to keyword-only, raw and positional
+    notify subscribers alike.
+    """
+    broker.clear()
+    broker.set_flag_sates(on_emit=True)
+    notifications: list[str] = []
+
+    @broker.subscribe(broker.BROKER_ON_EMIT, priority=3)
+    def on_emit_keyword(*, using: str) -> None:
+        notifications.append(f"keyword: {using}")
+
+    @broker.subscribe(broker.BROKER_ON_EMIT, priority=2, raw=True)
+    def on_emit_raw(kwargs: dict[str, str]) -> None:
+        notifications.append(f"raw: {kwargs['using']}")
+
+    @broker.subscribe(broker.BROKER_ON_EMIT, priority=1, positional=("using",))
+    def on_emit_positional(namespace: str) -> None:
+        notifications.append(f"positional: {namespace}")
+
+    broker.emit("test.event")
+    broker.set_flag_sates()
+
+    assert notifications == [
+        "keyword: test.event",
+        "raw: test.event",
+        "positional: test.event",
+    ]
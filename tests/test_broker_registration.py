@@ -1,4 +1,7 @@
 import asyncio
+import json
+import threading
+from enum import Enum
 from typing import Any
 
 import pytest
@@ -195,3 +198,225 @@ def test_subscribe_decorator_enforces_signature_matching() -> None:
         @broker.subscribe("test.signature")
         def second_handler(name: str, email: str) -> None:
             pass
+
+
+def test_unregistered_wildcard_stops_receiving() -> None:
+    """
+    Test that an unregistered wildcard subscriber no longer receives events
+    while exact subscribers under its root still do.
+    """
+    broker.clear()
+    wildcard_invoked: list[str] = []
+    exact_invoked: list[str] = []
+
+    def wildcard_callback(data: str) -> None:
+        wildcard_invoked.append(data)
+
+    def exact_callback(data: str) -> None:
+        exact_invoked.append(data)
+
+    broker.register_subscriber("test.*", wildcard_callback)
+    broker.register_subscriber("test.event", exact_callback)
+    broker.emit("test.event", data="first")
+
+    broker.unregister_subscriber("test.*", wildcard_callback)
+    broker.emit("test.event", data="second")
+
+    assert wildcard_invoked == ["first"]
+    assert exact_invoked == ["first", "second"]
+
+
+def test_async_methods_of_several_instances_are_awaited() -> None:
+    """
+    Test that async instance methods are recognized as async for every
+    instance registered, not only the first one.
+    """
+    broker.clear()
+    invoked: list[str] = []
+
+    class Handler(object):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        async def on_event(self, data: str) -> None:
+            await asyncio.sleep(0)
+            invoked.append(f"{self.name}: {data}")
+
+    first = Handler("first")
+    second = Handler("second")
+    broker.register_subscriber("test.async", first.on_event)
+    broker.register_subscriber("test.async", second.on_event)
+
+    broker.emit("test.async", data="sync")
+    asyncio.run(broker.emit_async("test.async", data="async"))
+
+    assert sorted(invoked) == ["first: async", "second: async"]
+
+
+def test_unregistering_unknown_callback_keeps_subscribers() -> None:
+    """
+    Test that unregistering a callback that was never registered leaves the
+    namespace's existing subscribers in place.
+    """
+    broker.clear()
+    namespace = "test.unknown"
+    received: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def registered(**kwargs: Any) -> None:
+        received.append("registered")
+
+    # noinspection PyUnusedLocal
+    def never_registered(**kwargs: Any) -> None:
+        received.append("never registered")
+
+    broker.register_subscriber(namespace, registered)
+    broker.emit(namespace)
+    broker.unregister_subscriber(namespace, never_registered)
+    broker.emit(namespace)
+
+    assert received == ["registered", "registered"]
+
+
+def test_concurrent_registration_and_emit() -> None:
+    """
+    Test that registering and unregistering from several threads while
+    another emits keeps the broker consistent.
+    """
+    broker.clear()
+    namespace = "test.threads"
+    errors: list[BaseException] = []
+    done = threading.Event()
+    callbacks = []
+
+    for _ in range(8):
+        # noinspection PyUnusedLocal
+        def callback(**kwargs: Any) -> None:
+            pass
+
+        callbacks.append(callback)
+
+    def churn(callback: Any) -> None:
+        try:
+            for _ in range(200):
+                broker.register_subscriber(namespace, callback)
+                broker.unregister_subscriber(namespace, callback)
+            broker.register_subscriber(namespace, callback)
+        except BaseException as error:
+            errors.append(error)
+
+    def emitter() -> None:
+        try:
+            while not done.is_set():
+                broker.emit(namespace, value=1)
+        except BaseException as error:
+            errors.append(error)
+
+    emit_thread = threading.Thread(target=emitter)
+    emit_thread.start()
+    threads = [threading.Thread(target=churn, args=(cb,)) for cb in callbacks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    emit_thread.join()
+
+    received: list[int] = []
+
+    def counter(value: int) -> None:
+        received.append(value)
+
+    broker.register_subscriber(namespace, counter)
+    broker.emit(namespace, value=1)
+
+    assert errors == []
+    assert received == [1]
+
+
+def test_to_string_lists_subscribers_as_json() -> None:
+    """
+    Test that to_string lists each namespace's subscribers in execution order
+    as indented JSON.
+    """
+    broker.clear()
+    assert broker.to_string() == "{}"
+
+    # noinspection PyUnusedLocal
+    def low(**kwargs: Any) -> None:
+        pass
+
+    # noinspection PyUnusedLocal
+    async def high(**kwargs: Any) -> None:
+        pass
+
+    broker.register_subscriber("test.string", low)
+    broker.register_subscriber("test.string", high, priority=2)
+    output = broker.to_string()
+
+    assert json.loads(output) == {
+        "test.string": [
+            f"{__name__}.{high.__qualname__} [priority=2] [async]",
+            f"{__name__}.{low.__qualname__}",
+        ]
+    }
+    assert output == json.dumps(json.loads(output), indent=4)
+
+
+def test_namespaces_can_be_readded_after_removal() -> None:
+    """
+    Test that namespaces below a removed namespace can be registered again
+    and still match wildcard subscribers above them.
+    """
+    broker.clear()
+    received: list[str] = []
+
+    # noinspection PyUnusedLocal
+    def exact(**kwargs: Any) -> None:
+        received.append("exact")
+
+    # noinspection PyUnusedLocal
+    def wildcard(**kwargs: Any) -> None:
+        received.append("wildcard")
+
+    broker.register_subscriber("test.*", wildcard)
+    broker.register_subscriber("test.branch.leaf", exact)
+    broker.unregister_subscriber("test.branch.leaf", exact)
+    broker.register_subscriber("test.branch.other", exact)
+
+    broker.emit("test.branch.leaf")
+    broker.emit("test.branch.other")
+
+    assert received == ["wildcard", "wildcard", "exact"]
+
+
+class _Topic(str, Enum):
+    SAVE = "test.file.save"
+    ANY = "test.file.*"
+
+
+def test_str_enum_namespaces() -> None:
+    """Test that str subclasses such as str enums work as namespaces."""
+    broker.clear()
+    received: list[str] = []
+
+    def on_save(filename: str) -> None:
+        received.append(f"save: {filename}")
+
+    def on_any(filename: str) -> None:
+        received.append(f"any: {filename}")
+
+    broker.register_subscriber(_Topic.SAVE, on_save, priority=1)
+    broker.register_subscriber(_Topic.ANY, on_any)
+    broker.emit(_Topic.SAVE, filename="a.txt")
+    broker.emit("test.file.save", filename="b.txt")
+    broker.unregister_subscriber(_Topic.SAVE, on_save)
+    broker.emit(_Topic.SAVE, filename="c.txt")
+
+    assert received == [
+        "save: a.txt",
+        "any: a.txt",
+        "save: b.txt",
+        "any: b.txt",
+        "any: c.txt",
+    ]
@@ -4,6 +4,7 @@ notifications.
 """
 
 import gc
+import weakref
 
 import pytest
 
@@ -329,3 +330,44 @@ def test_wildcard_subscriber_collection() -> None:
     gc.collect()
 
     assert "test.*" in collected_namespaces
+
+
+def test_signature_cache_does_not_prevent_collection() -> None:
+    """
+    Test that caching callback parameters does not keep the callback alive
+    once it has been registered to several namespaces.
+    """
+    broker.clear()
+
+    def my_callback(data: str) -> None:
+        pass
+
+    broker.register_subscriber("test.first", my_callback)
+    broker.register_subscriber("test.second", my_callback)
+    callback_ref = weakref.ref(my_callback)
+
+    del my_callback
+    gc.collect()
+
+    assert callback_ref() is None
+
+
+def test_subscriber_collected_during_emit_is_skipped() -> None:
+    """
+    Test that a subscriber collected by an earlier callback of the same emit
+    is skipped rather than called.
+    """
+    broker.clear()
+    invocations: list[str] = []
+    holder = [lambda data: invocations.append("late")]
+
+    def release(data: str) -> None:
+        invocations.append("release")
+        holder.clear()
+
+    broker.register_subscriber("test.event", release, priority=1)
+    broker.register_subscriber("test.event", holder[0])
+
+    broker.emit("test.event", data="first")
+
+    assert invocations == ["release"]